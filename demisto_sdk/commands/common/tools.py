@@ -172,6 +172,12 @@ GRAPH_SUPPORTED_FILE_TYPES = ["yml", "json"]
 
 
 class MarketplaceTagParser:
+    # the patterns do not depend on the marketplace, so they are compiled once for all parsers
+    TAG_PATTERN = re.compile(rf"<(?P<closing>/)?~(?P<name>{MARKETPLACE_LIST_PATTERN})>")
+    TAG_BLOCK_PATTERN = re.compile(
+        rf"<~({MARKETPLACE_LIST_PATTERN})>({TAG_CONTENT_PATTERN})</~\1>"
+    )
+
     def __init__(self, marketplace: str = MarketplaceVersions.XSOAR.value):
         self.marketplace = marketplace
 
@@ -188,12 +194,9 @@ class MarketplaceTagParser:
         Checks for unmatched <~...> and </~...> tags using a stack-based approach.
         Returns True if there are any mismatched or unmatched tags.
         """
-        tag_pattern = re.compile(
-            rf"<(?P<closing>/)?~(?P<name>{MARKETPLACE_LIST_PATTERN})>"
-        )
         stack = []
 
-        for match in tag_pattern.finditer(text):
+        for match in self.TAG_PATTERN.finditer(text):
             tag_name = match.group("name")
             is_closing = match.group("closing") is not None
 
@@ -233,13 +236,9 @@ class MarketplaceTagParser:
             )
             return text
 
-        regex_for_any_tag_block = (
-            rf"<~({MARKETPLACE_LIST_PATTERN})>({TAG_CONTENT_PATTERN})</~\1>"
-        )
-
         def filter_callback(match: re.Match) -> str:
             """
-            This function is called for each match found by `regex_for_any_tag_block`.
+            This function is called for each match found by `TAG_BLOCK_PATTERN`.
             It determines whether to keep the content or remove the entire block.
             """
             marketplaces_in_tag_str = match.group(1)
@@ -260,7 +259,7 @@ class MarketplaceTagParser:
             else:
                 return ""
 
-        filtered_rn = re.sub(regex_for_any_tag_block, filter_callback, text)
+        filtered_rn = self.TAG_BLOCK_PATTERN.sub(filter_callback, text)
         return filtered_rn
 
 
@@ -619,6 +619,20 @@ CONTENT_PRIVATE_ITEMS: dict = {
 }
 
 
+MARKETPLACE_REFERENCE = "Cortex XSOAR"
+MARKETPLACE_REFERENCE_PATTERN = re.compile(
+    r"\bCortex XSOAR\b(?![\S]*\/)(?:\s+[\w.]*\d[\w.]*)?(?!(?:.{0,20})https)"
+)
+
+
+def _replace_xsoar_reference(text: str) -> str:
+    # most texts have no reference at all, so they are not scanned by the pattern.
+    # str() keeps the result a plain string, as returned by the pattern for str subclasses too
+    if MARKETPLACE_REFERENCE not in text:
+        return str(text)
+    return MARKETPLACE_REFERENCE_PATTERN.sub("Cortex", text)
+
+
 def replace_marketplace_references(
     data: Any, marketplace: MarketplaceVersions, path: str = ""
 ) -> Any:
@@ -635,7 +649,6 @@ def replace_marketplace_references(
     Returns:
         Any: The same data object with replacements made if applicable.
     """
-    pattern = r"\bCortex XSOAR\b(?![\S]*\/)(?:\s+[\w.]*\d[\w.]*)?(?!(?:.{0,20})https)"
     try:
         if marketplace in {
             MarketplaceVersions.MarketplaceV2,
@@ -647,7 +660,7 @@ def replace_marketplace_references(
                 for key, value in data.items():
                     # Process the key
                     new_key = (
-                        re.sub(pattern, "Cortex", key) if isinstance(key, str) else key
+                        _replace_xsoar_reference(key) if isinstance(key, str) else key
                     )
                     if new_key != key:
                         keys_to_update[key] = new_key
@@ -661,9 +674,9 @@ def replace_marketplace_references(
                     data[i] = replace_marketplace_references(data[i], marketplace, path)
             elif isinstance(data, FoldedScalarString):
                 # if data is a FoldedScalarString (yml unification), we need to convert it to a string and back
-                data = FoldedScalarString(re.sub(pattern, "Cortex", str(data)))
+                data = FoldedScalarString(_replace_xsoar_reference(data))
             elif isinstance(data, str):
-                data = re.sub(pattern, "Cortex", data)
+                data = _replace_xsoar_reference(data)
     except Exception as e:
         logger.error(
             f"Error processing data for replacing incorrect marketplace at path '{path}': {e}"
@@ -18,7 +18,7 @@ from typing import (
 
 import demisto_client
 from packaging.version import Version
-from pydantic import BaseModel, DirectoryPath, Field
+from pydantic import BaseModel, DirectoryPath, Field, PrivateAttr
 from pydantic.main import ModelMetaclass
 
 from demisto_sdk.commands.common.constants import (
@@ -105,6 +105,18 @@ class BaseNode(ABC, BaseModel, metaclass=BaseContentMetaclass):
     relationships_data: Dict[RelationshipType, Set["RelationshipData"]] = Field(
         defaultdict(set), exclude=True, repr=False
     )
+    # counts the relationships added by add_relationship, to tell when the index is stale
+    _relationships_version: int = PrivateAttr(0)
+    # relationship type -> (indexed relationships set, version, incoming, outgoing)
+    _relationships_index: Dict[
+        RelationshipType,
+        Tuple[
+            Set["RelationshipData"],
+            int,
+            Tuple["RelationshipData", ...],
+            Tuple["RelationshipData", ...],
+        ],
+    ] = PrivateAttr(default_factory=dict)
 
     class Config:
         arbitrary_types_allowed = (
@@ -194,6 +206,61 @@ class BaseNode(ABC, BaseModel, metaclass=BaseContentMetaclass):
             # skip adding circular dependency
             return
         self.relationships_data[relationship_type].add(relationship)
+        object.__setattr__(
+            self, "_relationships_version", self._get_relationships_version() + 1
+        )
+
+    def _get_relationships_version(self) -> int:
+        # private attributes are not pickled, so they are missing on unpickled objects
+        return getattr(self, "_relationships_version", 0)
+
+    def _split_relationships(
+        self, relationship_type: RelationshipType
+    ) -> Tuple[Tuple["RelationshipData", ...], Tuple["RelationshipData", ...]]:
+        """
+        Splits the relationships of the given type by their direction.
+        The split is kept until a relationship is added or the relationships data is replaced,
+        so repeated lookups do not rescan them. Relationships must only be added with `add_relationship`.
+        It is kept as tuples, so callers cannot change it.
+
+        Returns:
+            The relationships whose source is the related content item (incoming),
+            and the relationships whose target is the related content item (outgoing).
+        """
+        relationships = self.relationships_data[relationship_type]
+        version = self._get_relationships_version()
+        # the index is missing on unpickled objects, as private attributes are not pickled
+        index = getattr(self, "_relationships_index", None)
+        if index is None:
+            index = {}
+            object.__setattr__(self, "_relationships_index", index)
+        cached = index.get(relationship_type)
+        if cached is not None and cached[0] is relationships and cached[1] == version:
+            return cached[2], cached[3]
+
+        incoming: List["RelationshipData"] = []
+        outgoing: List["RelationshipData"] = []
+        for r in relationships:
+            database_id = r.content_item_to.database_id
+            if database_id == r.source_id:
+                incoming.append(r)
+            if database_id == r.target_id:
+                outgoing.append(r)
+        split = tuple(incoming), tuple(outgoing)
+        index[relationship_type] = (relationships, version, *split)
+        return split
+
+    def incoming_relationships(
+        self, relationship_type: RelationshipType
+    ) -> List["RelationshipData"]:
+        """The relationships of the given type from another content item to this one."""
+        return list(self._split_relationships(relationship_type)[0])
+
+    def outgoing_relationships(
+        self, relationship_type: RelationshipType
+    ) -> List["RelationshipData"]:
+        """The relationships of the given type from this content item to another one."""
+        return list(self._split_relationships(relationship_type)[1])
 
 
 class BaseContent(BaseNode):
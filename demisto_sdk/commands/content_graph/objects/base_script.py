@@ -15,6 +15,9 @@ from demisto_sdk.commands.content_graph.common import (
     ContentType,
     RelationshipType,
 )
+from demisto_sdk.commands.content_graph.objects.content_item import (
+    normalize_file_name,
+)
 from demisto_sdk.commands.content_graph.objects.integration import (
     Integration,
 )
@@ -89,8 +92,7 @@ class BaseScript(IntegrationScript, content_type=ContentType.BASE_SCRIPT):  # ty
     def imported_by(self) -> List[Integration]:
         return [
             r.content_item_to  # type: ignore[misc]
-            for r in self.relationships_data[RelationshipType.IMPORTS]
-            if r.content_item_to.database_id == r.source_id
+            for r in self.incoming_relationships(RelationshipType.IMPORTS)
         ]  # type: ignore[return-value]
 
     def dump(  # type: ignore[override]
@@ -101,30 +103,28 @@ class BaseScript(IntegrationScript, content_type=ContentType.BASE_SCRIPT):  # ty
     ) -> None:
         dir.mkdir(exist_ok=True, parents=True)
         data = self.prepare_for_upload(current_marketplace=marketplace, **kwargs)
+        handler = self.handler
 
         for data in MarketplaceIncidentToAlertScriptsPreparer.prepare(
             data, marketplace, self.is_incident_to_alert(marketplace)
         ):
             # Two scripts return from the preparation, one the original, and other the new script,
-            # in order to normalize the name of the new script, make a copy of the original object
-            # in case it is a new script with an update of the name and path.
+            # in case it is a new script, its file name is normalized from the updated name,
+            # without copying the whole model just for that.
             script_name = data.get("name")
 
             if script_name == self.name:  # the original script
-                obj = self
+                path = self.path
+                file_name = self.normalize_name
 
             else:  # a modified script, replaced incidents->alerts
-                obj = self.copy(
-                    update={
-                        "name": script_name,
-                        "path": self.path.with_name(f"{script_name}.yml"),
-                    }
-                )
+                path = self.path.with_name(f"{script_name}.yml")
+                file_name = normalize_file_name(path.name, self.content_type)
             try:
-                write_dict(dir / obj.normalize_name, data=data, handler=obj.handler)
+                write_dict(dir / file_name, data=data, handler=handler)
 
             except FileNotFoundError as e:
-                logger.warning(f"Failed to dump {obj.path} to {dir}: {e}")
+                logger.warning(f"Failed to dump {path} to {dir}: {e}")
 
     def is_incident_to_alert(
         self, marketplace: Union[List[MarketplaceVersions], MarketplaceVersions]
@@ -142,13 +142,14 @@ class BaseScript(IntegrationScript, content_type=ContentType.BASE_SCRIPT):  # ty
         """
         if not isinstance(marketplace, list):
             marketplace = [marketplace]
-        return all(
+        # cheapest checks first, the name is lowercased only when the others pass
+        return (
             (
                 MarketplaceVersions.MarketplaceV2 in marketplace
-                or MarketplaceVersions.PLATFORM in marketplace,
-                "incident" in self.name.lower(),
-                SKIP_PREPARE_SCRIPT_NAME not in self.skip_prepare,
+                or MarketplaceVersions.PLATFORM in marketplace
             )
+            and SKIP_PREPARE_SCRIPT_NAME not in self.skip_prepare
+            and "incident" in self.name.lower()
         )
 
     @classmethod
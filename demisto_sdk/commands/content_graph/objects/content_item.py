@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Union
@@ -45,6 +46,29 @@ from demisto_sdk.commands.prepare_content.preparers.marketplace_suffix_preparer
 )
 
 
+@lru_cache(maxsize=4096)
+def normalize_file_name(file_name: str, content_type: ContentType) -> str:
+    """
+    Adds the server prefix of the content type to the file name, removing the existing server prefixes.
+    Cached, as it is called for every content item when dumping and uploading packs.
+
+    Args:
+        file_name (str): content item file name.
+        content_type (ContentType): content item type.
+    Returns:
+        str: The normalized name.
+    """
+    name = file_name
+    server_names = ContentType.server_names()
+    for _ in range(2):
+        # we iterate twice to handle cases of doubled prefixes like `classifier-mapper-`
+        for prefix in server_names:
+            name = name.removeprefix(f"{prefix}-")
+    normalized = f"{content_type.server_name}-{name}"
+    logger.debug(f"Normalized file name from {name} to {normalized}")
+    return normalized
+
+
 class ContentItem(BaseContent):
     path: Path
     marketplaces: List[MarketplaceVersions]
@@ -198,11 +222,7 @@ class ContentItem(BaseContent):
                     mandatorily: bool = False
 
         """
-        return [
-            r
-            for r in self.relationships_data[RelationshipType.USES]
-            if r.content_item_to.database_id == r.target_id
-        ]
+        return self.outgoing_relationships(RelationshipType.USES)
 
     @property
     def tested_by(self) -> List["TestPlaybook"]:
@@ -214,8 +234,7 @@ class ContentItem(BaseContent):
         """
         return [
             r.content_item_to  # type: ignore[misc]
-            for r in self.relationships_data[RelationshipType.TESTED_BY]
-            if r.content_item_to.database_id == r.target_id
+            for r in self.outgoing_relationships(RelationshipType.TESTED_BY)
         ]
 
     @property
@@ -241,11 +260,7 @@ class ContentItem(BaseContent):
                     mandatorily: bool = False
 
         """
-        return [
-            r
-            for r in self.relationships_data[RelationshipType.USES]
-            if r.content_item_to.database_id == r.source_id
-        ]
+        return self.incoming_relationships(RelationshipType.USES)
 
     @property
     def handler(self) -> XSOAR_Handler:
@@ -360,20 +375,10 @@ class ContentItem(BaseContent):
         This will add the server prefix of the content item to its name
         In addition it will remove the existing server_names of the name.
 
-        Args:
-            name (str): content item name.
         Returns:
             str: The normalized name.
         """
-        name = self.path.name
-        server_names = ContentType.server_names()
-        for _ in range(2):
-            # we iterate twice to handle cases of doubled prefixes like `classifier-mapper-`
-            for prefix in server_names:
-                name = name.removeprefix(f"{prefix}-")
-        normalized = f"{self.content_type.server_name}-{name}"
-        logger.debug(f"Normalized file name from {name} to {normalized}")
-        return normalized
+        return normalize_file_name(self.path.name, self.content_type)
 
     def dump(  # type: ignore[override]
         self,
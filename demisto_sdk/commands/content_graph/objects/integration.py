@@ -88,8 +88,7 @@ class Command(BaseNode, content_type=ContentType.COMMAND):  # type: ignore[call-
     def integrations(self) -> List["Integration"]:
         return [
             r.content_item_to  # type: ignore[misc]
-            for r in self.relationships_data[RelationshipType.HAS_COMMAND]
-            if r.content_item_to.database_id == r.source_id
+            for r in self.incoming_relationships(RelationshipType.HAS_COMMAND)
         ]
 
     def dump(self, *args, **kwargs) -> None:
@@ -145,8 +144,7 @@ class Integration(IntegrationScript, content_type=ContentType.INTEGRATION):  # t
     def imports(self) -> List["Script"]:
         return [
             r.content_item_to  # type: ignore[misc]
-            for r in self.relationships_data[RelationshipType.IMPORTS]
-            if r.content_item_to.database_id == r.target_id
+            for r in self.outgoing_relationships(RelationshipType.IMPORTS)
         ]
 
     def set_commands(self):
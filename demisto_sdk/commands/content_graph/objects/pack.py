@@ -1,16 +1,19 @@
+import os
 import shutil
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from configparser import ConfigParser
 from configparser import Error as ConfigParserError
-from functools import cached_property
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import IO, TYPE_CHECKING, List, Optional, Tuple, Union
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import demisto_client
 from demisto_client.demisto_api.rest import ApiException
 from packaging.version import Version, parse
-from pydantic import DirectoryPath, Field, validator
+from pydantic import DirectoryPath, Field, PrivateAttr, validator
 
 from demisto_sdk.commands.common.constants import (
     BASE_PACK,
@@ -29,6 +32,7 @@ from demisto_sdk.commands.common.git_util import (
     GitUtil,
 )
 from demisto_sdk.commands.common.logger import logger
+from demisto_sdk.commands.common.string_to_bool import string_to_bool
 from demisto_sdk.commands.common.tools import (
     MarketplaceTagParser,
     get_file,
@@ -78,7 +82,6 @@ from demisto_sdk.commands.upload.constants import (
     CONTENT_TYPES_EXCLUDED_FROM_UPLOAD,
     CONTENT_TYPES_NOT_SUPPORTED_IN_UPLOAD,
     MULTIPLE_ZIPPED_PACKS_FILE_NAME,
-    MULTIPLE_ZIPPED_PACKS_FILE_STEM,
 )
 from demisto_sdk.commands.upload.exceptions import IncompatibleUploadVersionException
 from demisto_sdk.commands.upload.tools import (
@@ -92,6 +95,137 @@ if TYPE_CHECKING:
 
 MINIMAL_UPLOAD_SUPPORTED_VERSION = Version("6.5.0")
 MINIMAL_ALLOWED_SKIP_VALIDATION_VERSION = Version("6.6.0")
+# The same few fromversion values repeat across all content items
+_parse_version = lru_cache(maxsize=4096)(parse)
+DUMP_PARALLELISM_ENV_VAR = "DEMISTO_SDK_DUMP_PARALLELISM"
+UPLOAD_PARALLELISM_ENV_VAR = "DEMISTO_SDK_UPLOAD_PARALLELISM"
+# the uploads are bound by the server, so they are not scaled by the local CPU count
+DEFAULT_UPLOAD_MAX_WORKERS = 8
+ZIP_LEVEL_ENV_VAR = "DEMISTO_SDK_ZIP_LEVEL"
+# the zips are extracted right away by the server, so speed is preferred over size
+DEFAULT_ZIP_LEVEL = 1
+CONTENT_TYPE_TO_DUMP_FOLDER = {
+    content_type: content_type.as_folder for content_type in ContentType
+}
+# The content structure is different from the server
+CONTENT_TYPE_TO_DUMP_FOLDER[ContentType.CASE_LAYOUT] = ContentType.LAYOUT.as_folder
+# The content types skipped when dumping or uploading a pack, without and with test playbooks (tpb)
+_EXCLUDED_NO_TPB = frozenset(CONTENT_TYPES_EXCLUDED_FROM_UPLOAD)
+_EXCLUDED_TPB = _EXCLUDED_NO_TPB - {ContentType.TEST_PLAYBOOK}
+# The pack fields excluded from metadata.json, the public variant also excludes the private pack fields
+_META_EXCLUDE_BASE = frozenset(
+    {"path", "node_id", "content_type", "url", "email", "database_id"}
+)
+_META_EXCLUDE_PUBLIC = _META_EXCLUDE_BASE | frozenset(
+    {
+        "premium",
+        "vendor_id",
+        "partner_id",
+        "partner_name",
+        "preview_only",
+        "disable_monthly",
+    }
+)
+
+
+def _get_max_workers(env_var: str, default_max_workers: int) -> int:
+    """
+    Returns the number of threads set by the given environment variable, which may
+    hold a number of workers, or a false-like value (e.g. `false`, `0`) to run serially.
+    """
+    value = os.getenv(env_var, "")
+    if not value:
+        return default_max_workers
+    if value.isdigit():
+        return max(int(value), 1)
+    try:
+        return default_max_workers if string_to_bool(value) else 1
+    except ValueError:
+        logger.debug(
+            f"Invalid value {value} for {env_var}, using {default_max_workers} workers"
+        )
+        return default_max_workers
+
+
+def get_dump_max_workers() -> int:
+    """
+    Returns the number of threads used to dump the content items of a pack.
+
+    Controlled by the `DEMISTO_SDK_DUMP_PARALLELISM` environment variable, which may
+    hold a number of workers, or a false-like value (e.g. `false`, `0`) to dump serially.
+    """
+    return _get_max_workers(
+        DUMP_PARALLELISM_ENV_VAR, min(32, (os.cpu_count() or 1) * 4)
+    )
+
+
+def get_upload_max_workers() -> int:
+    """
+    Returns the number of content items of a pack uploaded concurrently, when uploading item by item.
+
+    Controlled by the `DEMISTO_SDK_UPLOAD_PARALLELISM` environment variable, the same as
+    `DEMISTO_SDK_DUMP_PARALLELISM`, so a false-like value uploads the items one after the other.
+    """
+    return _get_max_workers(UPLOAD_PARALLELISM_ENV_VAR, DEFAULT_UPLOAD_MAX_WORKERS)
+
+
+def get_zip_level() -> int:
+    """
+    Returns the compression level of the pack zips.
+
+    Controlled by the `DEMISTO_SDK_ZIP_LEVEL` environment variable, which may hold a level
+    between 0 and 9, where 0 stores the files without compressing them.
+    """
+    value = os.getenv(ZIP_LEVEL_ENV_VAR, "")
+    if value.isdigit() and int(value) <= 9:
+        return int(value)
+    if value:
+        logger.debug(
+            f"Invalid value {value} for {ZIP_LEVEL_ENV_VAR}, using level {DEFAULT_ZIP_LEVEL}"
+        )
+    return DEFAULT_ZIP_LEVEL
+
+
+def _has_marketplace_content(content: bytes) -> bool:
+    """
+    Returns whether the content may be changed by `replace_marketplace_references`
+    or by `MarketplaceTagParser.parse_text`, checked by their sentinel substrings.
+    """
+    return b"<~" in content or b"Cortex XSOAR" in content
+
+
+def _list_dir(path: Path) -> str:
+    """Returns the paths of the entries in the directory, one per line."""
+    with os.scandir(path) as entries:
+        return "\n".join(entry.path for entry in entries)
+
+
+def _fast_copy(
+    src: Union[str, Path], dst: Union[str, Path], link: bool = False
+) -> None:
+    """
+    Copies a file, hard-linking it instead when allowed.
+
+    Args:
+        src: The file to copy.
+        dst: The destination file path.
+        link: Whether to hard-link the file rather than copy it. Only safe when the
+            destination is temporary and is never modified in place.
+    """
+    if link:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass  # e.g. across file systems, falling back to a copy
+
+    # copyfile already copies in the kernel where supported (e.g. sendfile on Linux)
+    shutil.copyfile(src, dst)
+
+
+def _fast_copytree(src: Path, dst: Path, link: bool = False) -> None:
+    """Copies a directory tree, copying each of its files using `_fast_copy`."""
+    shutil.copytree(src, dst, copy_function=partial(_fast_copy, link=link))
 
 
 def upload_zip(
@@ -148,6 +282,8 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         PackContentItems(), alias="contentItems", exclude=True
     )
     pack_metadata_dict: Optional[dict] = Field({}, exclude=True)
+    # (pack path, the pack path relative to the content path)
+    _relative_path: Optional[Tuple[Path, Path]] = PrivateAttr(None)
 
     @classmethod
     def from_orm(cls, obj) -> "Pack":
@@ -172,12 +308,21 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
     def pack_id(self) -> str:
         return self.object_id
 
+    @property
+    def relative_path(self) -> Path:
+        """The pack path relative to the content path, kept as long as the pack path is not replaced."""
+        # the private attribute is missing on unpickled packs, as private attributes are not pickled
+        relative_path = getattr(self, "_relative_path", None)
+        if relative_path is None or relative_path[0] is not self.path:
+            relative_path = (self.path, get_relative_path(self.path, CONTENT_PATH))
+            object.__setattr__(self, "_relative_path", relative_path)
+        return relative_path[1]
+
     @property
     def ignored_errors(self) -> List[str]:
         if ignored_errors := self.get_ignored_errors(PACK_METADATA_FILENAME):
             return ignored_errors
-        file_path = get_relative_path(self.path, CONTENT_PATH)
-        return self.get_ignored_errors(file_path / PACK_METADATA_FILENAME)
+        return self.get_ignored_errors(self.relative_path / PACK_METADATA_FILENAME)
 
     @cached_property
     def pack_level_ignored_errors(self) -> List[str]:
@@ -285,15 +430,13 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
 
     def get_ignored_errors(self, path: Union[str, Path]) -> List[str]:
         try:
-            return (
-                list(
-                    self.ignored_errors_dict.get(  # type: ignore
-                        f"file:{path}", []
-                    ).items()
-                )[0][1].split(",")
-                or []
-            )
-        except:  # noqa: E722
+            section = self.ignored_errors_dict.get(f"file:{path}")
+            if not section:
+                return []
+            # the error codes are the value of the first (and only) key of the section
+            ignored_errors = next(iter(section.values()), "")
+            return ignored_errors.split(",") if ignored_errors else []
+        except (AttributeError, KeyError, ConfigParserError):
             logger.debug(f"Failed to extract ignored errors list from path {path}")
             return []
 
@@ -328,37 +471,29 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
                     mandatorily: bool = False
 
         """
-        return [
-            r
-            for r in self.relationships_data[RelationshipType.DEPENDS_ON]
-            if r.content_item_to.database_id == r.target_id
-        ]
+        return self.outgoing_relationships(RelationshipType.DEPENDS_ON)
 
     def set_content_items(self):
         content_items: List[ContentItem] = [
             r.content_item_to  # type: ignore[misc]
-            for r in self.relationships_data[RelationshipType.IN_PACK]
-            if r.content_item_to.database_id == r.source_id
+            for r in self.incoming_relationships(RelationshipType.IN_PACK)
         ]
         content_item_dct = defaultdict(list)
         for c in content_items:
             content_item_dct[c.content_type.value].append(c)
 
         # If there is no server_min_version, set it to the minimum of its content items fromversion
-        min_content_items_version = MARKETPLACE_MIN_VERSION
-        if content_items:
-            min_content_items_version = str(
-                min(
-                    [
-                        parse(content_item.fromversion)
-                        for content_item in content_items
-                        if not content_item.is_test
-                        and content_item.fromversion
-                        != DEFAULT_CONTENT_ITEM_FROM_VERSION
-                    ],
-                    default=MARKETPLACE_MIN_VERSION,
-                )
+        min_content_items_version = str(
+            min(
+                (
+                    _parse_version(content_item.fromversion)
+                    for content_item in content_items
+                    if not content_item.is_test
+                    and content_item.fromversion != DEFAULT_CONTENT_ITEM_FROM_VERSION
+                ),
+                default=MARKETPLACE_MIN_VERSION,
             )
+        )
         self.server_min_version = self.server_min_version or min_content_items_version
         self.content_items = PackContentItems(**content_item_dct)
 
@@ -409,12 +544,12 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
             logger.debug(
                 f"Failed reading {source} as JSON ({e}); falling back to plain copy"
             )
-            shutil.copy(source, destination)
+            _fast_copy(source, destination)
             return
 
         if not isinstance(pack_metadata, dict):
             logger.debug(f"{source} is not a JSON object; falling back to plain copy")
-            shutil.copy(source, destination)
+            _fast_copy(source, destination)
             return
 
         # Resolve marketplace-suffixed managed/source fields for the current
@@ -447,26 +582,12 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         self.server_min_version = self.server_min_version or MARKETPLACE_MIN_VERSION
         self._enhance_pack_properties(marketplace, self.object_id, self.content_items)
 
-        excluded_fields_from_metadata = {
-            "path",
-            "node_id",
-            "content_type",
-            "url",
-            "email",
-            "database_id",
-        }
+        excluded_fields_from_metadata = (
+            _META_EXCLUDE_BASE if self.is_private else _META_EXCLUDE_PUBLIC
+        )
         if strip_internal:
             # Strip `internal` so the uploaded pack will be visible to the user.
-            excluded_fields_from_metadata.add("internal")
-        if not self.is_private:
-            excluded_fields_from_metadata |= {
-                "premium",
-                "vendor_id",
-                "partner_id",
-                "partner_name",
-                "preview_only",
-                "disable_monthly",
-            }
+            excluded_fields_from_metadata = excluded_fields_from_metadata | {"internal"}
 
         metadata = self.dict(exclude=excluded_fields_from_metadata, by_alias=True)
         # Resolve marketplace-suffixed managed/source fields into the plain
@@ -492,7 +613,8 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         write_dict(path, data=metadata, indent=4, sort_keys=True)
 
     def dump_readme(self, path: Path, marketplace: MarketplaceVersions) -> None:
-        shutil.copyfile(self.path / "README.md", path)
+        # The readme is read and written once, all changes are applied in memory
+        content = (self.path / "README.md").read_bytes()
         if self.contributors:
             fixed_contributor_names = [
                 f" - {contrib_name}\n" for contrib_name in self.contributors
@@ -500,38 +622,42 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
             contribution_data = CONTRIBUTORS_README_TEMPLATE.format(
                 contributors_names="".join(fixed_contributor_names)
             )
-            with open(path, "a+") as f:
-                f.write(contribution_data)
-        with open(path, "r+") as f:
+            content += contribution_data.encode("utf-8")
+
+        if (
+            marketplace == MarketplaceVersions.XSOAR
+            and MarketplaceVersions.XSOAR_ON_PREM in self.marketplaces
+        ):
+            marketplace = MarketplaceVersions.XSOAR_ON_PREM
+
+        # Skip parsing when there is nothing to replace or filter in the readme
+        if self.contributors or _has_marketplace_content(content):
             try:
-                text = f.read()
+                text = content.decode("utf-8")
                 # Replace incorrect marketplace references
                 updated_text = replace_marketplace_references(
                     text, marketplace, str(self.path / "README.md")
                 )
-
-                if (
-                    marketplace == MarketplaceVersions.XSOAR
-                    and MarketplaceVersions.XSOAR_ON_PREM in self.marketplaces
-                ):
-                    marketplace = MarketplaceVersions.XSOAR_ON_PREM
-                parsed_text = MarketplaceTagParser(marketplace).parse_text(updated_text)
-                if len(text) != len(parsed_text):
-                    f.seek(0)
-                    f.write(parsed_text)
-                    f.truncate()
+                content = (
+                    MarketplaceTagParser(marketplace)
+                    .parse_text(updated_text)
+                    .encode("utf-8")
+                )
             except Exception as e:
                 logger.error(f"Failed dumping readme: {e}")
+        path.write_bytes(content)
 
         update_markdown_images_with_urls_and_rel_paths(
             path, marketplace, self.object_id, file_type=ImagesFolderNames.README_IMAGES
         )
 
-    def dump_release_notes(self, path: Path, marketplace: MarketplaceVersions) -> None:
+    def dump_release_notes(
+        self, path: Path, marketplace: MarketplaceVersions, link_files: bool = False
+    ) -> None:
         # TODO - Update this to dump the release notes for the platform marketplace
         # starting from platform supported version only.
         try:
-            shutil.copytree(self.path / "ReleaseNotes", path)
+            _fast_copytree(self.path / "ReleaseNotes", path, link=link_files)
         except FileNotFoundError:
             logger.debug(f'No such file {self.path / "ReleaseNotes"}')
 
@@ -557,8 +683,17 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
                   set by the ``demisto-sdk upload`` flow so that uploaded
                   content is visible to users; other flows (prepare-content,
                   artifact builds) keep the fields intact.
+                - ``link_files`` (bool): When true, files copied as-is from the
+                  pack (release notes, images, docs) are hard-linked where
+                  possible. Only safe when ``path`` is temporary and its files
+                  are never modified in place.
+                - ``max_workers`` (int): The number of threads dumping the content
+                  items, by default `get_dump_max_workers`. Set to 1 when the packs
+                  are already dumped in parallel processes.
         """
         tpb: bool = kwargs.pop("tpb", False)
+        link_files: bool = kwargs.pop("link_files", False)
+        max_workers: Optional[int] = kwargs.pop("max_workers", None)
         strip_internal: bool = kwargs.get("strip_internal", False)
 
         if not self.path.exists():
@@ -569,45 +704,37 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
             path.mkdir(exist_ok=True, parents=True)
 
             content_types_excluded_from_upload = (
-                CONTENT_TYPES_EXCLUDED_FROM_UPLOAD.copy()
+                _EXCLUDED_TPB if tpb else _EXCLUDED_NO_TPB
             )
 
-            if tpb:
-                content_types_excluded_from_upload.discard(ContentType.TEST_PLAYBOOK)
-
-            for content_item in self.content_items:
-                if content_item.content_type in content_types_excluded_from_upload:
+            items_to_dump: List[Tuple[ContentItem, Path]] = []
+            for content_type, items in self.content_items.items_by_type().items():
+                if content_type in content_types_excluded_from_upload:
                     logger.debug(
-                        f"SKIPPING dump {content_item.content_type} {content_item.normalize_name}"
+                        f"SKIPPING dump of {len(items)} {content_type} items "
                         "whose type was passed in `exclude_content_types`"
                     )
                     continue
 
-                if marketplace not in content_item.marketplaces:
-                    logger.debug(
-                        f"SKIPPING dump {content_item.content_type} {content_item.normalize_name}"
-                        f"to destination {marketplace=}"
-                        f" - content item has marketplaces {content_item.marketplaces}"
-                    )
-                    continue
-
-                folder = content_item.content_type.as_folder
-                if (
-                    content_item.content_type == ContentType.SCRIPT
-                    and content_item.is_test
-                ):
-                    folder = ContentType.TEST_PLAYBOOK.as_folder
-
-                # The content structure is different from the server
-                if folder == "CaseLayouts":
-                    folder = "Layouts"
-                dir = path / folder
-                content_item.upload_path = dir / content_item.normalize_name
-                content_item.dump(
-                    dir=dir,
-                    marketplace=marketplace,
-                    **kwargs,
-                )
+                for content_item in items:
+                    if marketplace not in content_item.marketplaces:
+                        logger.debug(
+                            f"SKIPPING dump {content_item.content_type} {content_item.normalize_name}"
+                            f"to destination {marketplace=}"
+                            f" - content item has marketplaces {content_item.marketplaces}"
+                        )
+                        continue
+
+                    dump_type = content_type
+                    if content_type == ContentType.SCRIPT and content_item.is_test:
+                        dump_type = ContentType.TEST_PLAYBOOK
+                    dir = path / CONTENT_TYPE_TO_DUMP_FOLDER[dump_type]
+                    content_item.upload_path = dir / content_item.normalize_name
+                    items_to_dump.append((content_item, dir))
+
+            self._dump_content_items(
+                items_to_dump, marketplace, max_workers=max_workers, **kwargs
+            )
             self.dump_metadata(
                 path / "metadata.json", marketplace, strip_internal=strip_internal
             )
@@ -619,35 +746,89 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
                 strip_internal=strip_internal,
             )
             try:
-                shutil.copy(
-                    self.path / VERSION_CONFIG_FILENAME, path / VERSION_CONFIG_FILENAME
+                _fast_copy(
+                    self.path / VERSION_CONFIG_FILENAME,
+                    path / VERSION_CONFIG_FILENAME,
+                    link=link_files,
                 )
             except FileNotFoundError:
                 logger.debug(f"No such file {self.path / VERSION_CONFIG_FILENAME}")
 
-            self.dump_release_notes(path / "ReleaseNotes", marketplace)
+            self.dump_release_notes(
+                path / "ReleaseNotes", marketplace, link_files=link_files
+            )
 
             try:
-                shutil.copy(self.path / "Author_image.png", path / "Author_image.png")
+                _fast_copy(
+                    self.path / "Author_image.png",
+                    path / "Author_image.png",
+                    link=link_files,
+                )
             except FileNotFoundError:
                 logger.debug(f'No such file {self.path / "Author_image.png"}')
 
             try:
-                shutil.copytree(self.path / "doc_files", path / "doc_files")
+                _fast_copytree(
+                    self.path / "doc_files", path / "doc_files", link=link_files
+                )
             except FileNotFoundError:
                 logger.debug(f'No such directory {self.path / "doc_files"}')
 
             if self.object_id == BASE_PACK:
                 self._copy_base_pack_docs(path, marketplace)
 
-            pack_files = "\n".join([str(f) for f in path.iterdir()])
             logger.info(f"Dumped pack {self.name}.")
-            logger.debug(f"Pack {self.name} files:\n{pack_files}")
+            # lazy, so the pack files are only listed when debug logs are emitted
+            # (loguru calls every argument of a lazy message)
+            logger.opt(lazy=True).debug(
+                "Pack {} files:\n{}", lambda: self.name, lambda: _list_dir(path)
+            )
 
         except Exception:
             logger.exception(f"Failed dumping pack {self.name}")
             raise
 
+    @staticmethod
+    def _dump_content_items(
+        items_to_dump: List[Tuple[ContentItem, Path]],
+        marketplace: MarketplaceVersions,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> None:
+        """Dumps the given content items, each into its matching directory.
+
+        The dumps are independent and mostly I/O bound, so they run on a thread pool
+        (see `get_dump_max_workers`). An exception raised by any dump is re-raised,
+        and the dumps that did not start yet are cancelled.
+
+        Args:
+            items_to_dump: Pairs of a content item and the directory to dump it into.
+            marketplace: Destination marketplace.
+            max_workers: The number of threads, by default `get_dump_max_workers`.
+            **kwargs: Forwarded to each ``ContentItem.dump``.
+        """
+        if max_workers is None:
+            max_workers = get_dump_max_workers()
+        max_workers = min(max_workers, len(items_to_dump))
+        if max_workers <= 1:
+            for content_item, dir in items_to_dump:
+                content_item.dump(dir=dir, marketplace=marketplace, **kwargs)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    content_item.dump, dir=dir, marketplace=marketplace, **kwargs
+                )
+                for content_item, dir in items_to_dump
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+
     def upload(
         self,
         client: demisto_client,
@@ -656,6 +837,7 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         destination_zip_dir: Optional[Path] = None,
         zip: bool = True,
         tpb: bool = False,
+        keep_zip: bool = False,
         **kwargs,
     ):
         if destination_zip_dir is None:
@@ -669,6 +851,7 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
                 skip_validations=kwargs.get("skip_validations", False),
                 destination_dir=destination_zip_dir,
                 tpb=tpb,
+                keep_zip=keep_zip,
             )
         else:
             self._upload_item_by_item(
@@ -686,53 +869,87 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         marketplace: MarketplaceVersions,
         destination_dir: DirectoryPath,
         tpb: bool = False,
+        keep_zip: bool = False,
     ) -> bool:
         # this should only be called from Pack.upload
         logger.debug(f"Uploading zipped pack {self.object_id}")
 
         # 1) dump the pack into a temporary file
-        with TemporaryDirectory() as temp_dump_dir:
+        with (
+            TemporaryDirectory() as temp_dump_dir,
+            TemporaryDirectory() as pack_zips_dir,
+        ):
             temp_dir_path = Path(temp_dump_dir)
             # strip_internal=True: this is an upload flow, so the `internal`
             # and `isInternal` fields should be removed from the dumped
             # script YAMLs and pack metadata so the uploaded content is
             # visible to users.
+            # link_files=True: the dump directory is removed right after
+            # zipping, so the files copied as-is can be hard-linked.
             self.dump(
                 temp_dir_path,
                 marketplace=marketplace,
                 tpb=tpb,
                 strip_internal=True,
+                link_files=True,
             )
 
             # 2) zip the dumped pack
-            with TemporaryDirectory() as pack_zips_dir:
-                pack_zip_path = Path(
-                    shutil.make_archive(
-                        str(Path(pack_zips_dir, self.name)), "zip", temp_dir_path
-                    )
-                )
-                str(pack_zip_path)
-
-                # 3) zip the zipped pack into uploadable_packs.zip under the result directory
-                try:
-                    shutil.make_archive(
-                        str(destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_STEM),
-                        "zip",
-                        pack_zips_dir,
-                    )
-                except Exception:
-                    logger.exception(
-                        f"Cannot write to {str(destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_NAME)}"
+            pack_zip_path = self._make_pack_zip(temp_dir_path, Path(pack_zips_dir))
+
+            # 3) if requested, zip the zipped pack into uploadable_packs.zip under the result directory
+            if keep_zip:
+                self._wrap_into_uploadable(pack_zip_path, destination_dir)
+
+            # upload the pack zip (not the result)
+            return upload_zip(
+                path=pack_zip_path,
+                client=client,
+                target_demisto_version=target_demisto_version,
+                skip_validations=skip_validations,
+                marketplace=marketplace,
+            )
+
+    def _make_pack_zip(self, dump_dir: Path, zips_dir: Path) -> Path:
+        """Zips a dumped pack into `<pack name>.zip` under `zips_dir`, and returns its path."""
+        pack_zip_path = zips_dir / f"{self.name}.zip"
+        self.zip_dumped_pack(dump_dir, pack_zip_path)
+        return pack_zip_path
+
+    @staticmethod
+    def zip_dumped_pack(dump_dir: Path, file: Union[Path, IO[bytes]]) -> None:
+        """Zips a dumped pack in a single pass over its files.
+
+        Args:
+            dump_dir: The directory the pack was dumped into.
+            file: The zip file path, or a writable stream (e.g. an entry of another zip file),
+                so the pack zip does not have to be written to disk first.
+        """
+        zip_level = get_zip_level()
+        with ZipFile(
+            file,
+            "w",
+            compression=ZIP_DEFLATED if zip_level else ZIP_STORED,
+            compresslevel=zip_level or None,
+        ) as zip_file:
+            for root, dir_names, file_names in os.walk(dump_dir):
+                root_path = Path(root)
+                # directories are added as entries as well, the same as shutil.make_archive does
+                for name in sorted(dir_names) + file_names:
+                    zip_file.write(
+                        root_path / name, (root_path / name).relative_to(dump_dir)
                     )
 
-                # upload the pack zip (not the result)
-                return upload_zip(
-                    path=pack_zip_path,
-                    client=client,
-                    target_demisto_version=target_demisto_version,
-                    skip_validations=skip_validations,
-                    marketplace=marketplace,
-                )
+    @staticmethod
+    def _wrap_into_uploadable(pack_zip_path: Path, destination_dir: Path) -> None:
+        """Writes the pack zip into `uploadable_packs.zip` under `destination_dir`."""
+        uploadable_zip_path = destination_dir / MULTIPLE_ZIPPED_PACKS_FILE_NAME
+        try:
+            # the pack zip is already compressed, so it is stored as is
+            with ZipFile(uploadable_zip_path, "w", compression=ZIP_STORED) as zip_file:
+                zip_file.write(pack_zip_path, pack_zip_path.name)
+        except Exception:
+            logger.exception(f"Cannot write to {uploadable_zip_path}")
 
     def _upload_item_by_item(
         self,
@@ -748,62 +965,77 @@ class Pack(BaseContent, PackMetadata, content_type=ContentType.PACK):
         upload_failures: List[FailedUploadException] = []
         uploaded_successfully: List[ContentItem] = []
         incompatible_content_items = []
+        items_to_upload: List[ContentItem] = []
 
-        content_types_excluded_from_upload = CONTENT_TYPES_EXCLUDED_FROM_UPLOAD.copy()
-        if tpb:
-            content_types_excluded_from_upload.discard(ContentType.TEST_PLAYBOOK)
+        content_types_excluded_from_upload = _EXCLUDED_TPB if tpb else _EXCLUDED_NO_TPB
 
-        for item in self.content_items:
-            if item.content_type in CONTENT_TYPES_NOT_SUPPORTED_IN_UPLOAD:
-                upload_failures.append(
+        for content_type, items in self.content_items.items_by_type().items():
+            if content_type in CONTENT_TYPES_NOT_SUPPORTED_IN_UPLOAD:
+                upload_failures.extend(
                     FailedUploadException(
                         item.path,
                         response_body={},
                         additional_info=(
-                            f"{item.content_type} is not a content item and therefore cannot be uploaded as part of a pack"
+                            f"{content_type} is not a content item and therefore cannot be uploaded as part of a pack"
                         ),
                     )
+                    for item in items
                 )
                 continue
 
-            if item.content_type in content_types_excluded_from_upload:
+            if content_type in content_types_excluded_from_upload:
                 logger.debug(
-                    f"SKIPPING upload of {item.content_type} {item.object_id}: type is skipped"
+                    f"SKIPPING upload of {len(items)} {content_type} items: type is skipped"
                 )
                 continue
 
-            try:
-                logger.debug(
-                    f"uploading pack {self.object_id}: {item.content_type} {item.object_id}"
-                )
-                item.upload(
-                    client=client,
-                    marketplace=marketplace,
-                    target_demisto_version=target_demisto_version,
-                )
-                uploaded_successfully.append(item)
-            except NotIndivitudallyUploadableException:
-                if marketplace in [
-                    MarketplaceVersions.MarketplaceV2,
-                    MarketplaceVersions.PLATFORM,
-                ]:
-                    raise  # many XSIAM content types must be uploaded zipped.
-                logger.warning(
-                    f"Not uploading pack {self.object_id}: {item.content_type} {item.object_id} as it was not indivudally uploaded"
-                )
-            except ApiException as e:
-                upload_failures.append(
-                    FailedUploadException(
-                        item.path,
-                        response_body={},
-                        additional_info=parse_error_response(e),
-                    )
-                )
-            except IncompatibleUploadVersionException as e:
-                incompatible_content_items.append(e)
+            items_to_upload.extend(items)
 
-            except FailedUploadException as e:
-                upload_failures.append(e)
+        def upload_item(item: ContentItem) -> None:
+            logger.debug(
+                f"uploading pack {self.object_id}: {item.content_type} {item.object_id}"
+            )
+            item.upload(
+                client=client,
+                marketplace=marketplace,
+                target_demisto_version=target_demisto_version,
+            )
+
+        # the uploads are independent requests, so they are sent concurrently,
+        # their results are handled in the order of the content items.
+        with ThreadPoolExecutor(max_workers=get_upload_max_workers()) as executor:
+            futures = [executor.submit(upload_item, item) for item in items_to_upload]
+            try:
+                for item, future in zip(items_to_upload, futures):
+                    try:
+                        future.result()
+                        uploaded_successfully.append(item)
+                    except NotIndivitudallyUploadableException:
+                        if marketplace in [
+                            MarketplaceVersions.MarketplaceV2,
+                            MarketplaceVersions.PLATFORM,
+                        ]:
+                            raise  # many XSIAM content types must be uploaded zipped.
+                        logger.warning(
+                            f"Not uploading pack {self.object_id}: {item.content_type} {item.object_id} as it was not indivudally uploaded"
+                        )
+                    except ApiException as e:
+                        upload_failures.append(
+                            FailedUploadException(
+                                item.path,
+                                response_body={},
+                                additional_info=parse_error_response(e),
+                            )
+                        )
+                    except IncompatibleUploadVersionException as e:
+                        incompatible_content_items.append(e)
+
+                    except FailedUploadException as e:
+                        upload_failures.append(e)
+            except BaseException:
+                # the remaining items are not uploaded once an item fails unexpectedly
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
 
         if upload_failures or incompatible_content_items:
             raise FailedUploadMultipleException(
@@ -1,6 +1,5 @@
 from typing import Any, Dict, Generator, List
 
-from more_itertools import map_reduce
 from pydantic import BaseModel, Field
 
 from demisto_sdk.commands.content_graph.common import ContentType
@@ -126,7 +125,13 @@ class PackContentItems(BaseModel):
             yield from content_items
 
     def items_by_type(self) -> Dict[ContentType, List[ContentItem]]:
-        return map_reduce(iter(self), lambda i: i.content_type)
+        """Returns the content items grouped by their content type, without the types that have no items.
+        The fields are already grouped by type, so the items are not grouped one by one."""
+        return {
+            ContentType(field.alias): list(content_items)
+            for name, field in self.__fields__.items()
+            if (content_items := getattr(self, name))
+        }
 
     def __bool__(self) -> bool:
         """Used for easier determination of content items existence in a pack."""
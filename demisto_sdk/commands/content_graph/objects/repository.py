@@ -138,7 +138,8 @@ class ContentDTO(BaseModel):
             # via ``functools.partial`` instead.
             from functools import partial
 
-            dump_fn = partial(Pack.dump, **kwargs)
+            # the packs are already dumped in parallel, so each dumps its items serially
+            dump_fn = partial(Pack.dump, **{"max_workers": 1, **kwargs})
             with Pool(processes=cpu_count()) as pool:
                 pool.starmap(
                     dump_fn,
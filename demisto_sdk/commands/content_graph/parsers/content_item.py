@@ -1,6 +1,6 @@
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Type, cast
+from typing import AbstractSet, Any, Dict, List, Optional, Type, cast
 
 from packaging.version import Version
 from pydantic import Field
@@ -262,7 +262,7 @@ class ContentItemParser(BaseContentParser, metaclass=ParserMetaclass):
 
     @property
     @abstractmethod
-    def supported_marketplaces(self) -> Set[MarketplaceVersions]:
+    def supported_marketplaces(self) -> AbstractSet[MarketplaceVersions]:
         pass
 
     @property
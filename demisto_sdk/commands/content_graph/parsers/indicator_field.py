@@ -1,6 +1,6 @@
 from functools import cached_property
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import FrozenSet, List, Optional
 
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.tools import get_value
@@ -12,6 +12,16 @@ from demisto_sdk.commands.content_graph.strict_objects.indicator_field import (
     StrictIndicatorField,
 )
 
+_SUPPORTED_MARKETPLACES = frozenset(
+    {
+        MarketplaceVersions.XSOAR,
+        MarketplaceVersions.MarketplaceV2,
+        MarketplaceVersions.XSOAR_SAAS,
+        MarketplaceVersions.XSOAR_ON_PREM,
+        MarketplaceVersions.PLATFORM,
+    }
+)
+
 
 class IndicatorFieldParser(
     JSONContentItemParser, content_type=ContentType.INDICATOR_FIELD
@@ -26,10 +36,11 @@ class IndicatorFieldParser(
         super().__init__(
             path, pack_marketplaces, pack_supported_modules, git_sha=git_sha
         )
-        self.associated_to_all = self.json_data.get("associatedToAll")
-        self.select_values = self.json_data.get("selectValues")
-        self.required = self.json_data.get("required")
-        self.associated_types = self.json_data.get("associatedTypes")
+        json_data = self.json_data
+        self.associated_to_all = json_data.get("associatedToAll")
+        self.select_values = json_data.get("selectValues")
+        self.required = json_data.get("required")
+        self.associated_types = json_data.get("associatedTypes")
 
         self.connect_to_dependencies()
 
@@ -39,10 +50,9 @@ class IndicatorFieldParser(
 
     @cached_property
     def field_mapping(self):
-        super().field_mapping.update(
-            {"object_id": "id", "cli_name": "cliName", "type": "type"}
-        )
-        return super().field_mapping
+        field_mapping = super().field_mapping
+        field_mapping.update({"object_id": "id", "cli_name": "cliName", "type": "type"})
+        return field_mapping
 
     @property
     def cli_name(self) -> Optional[str]:
@@ -52,41 +62,29 @@ class IndicatorFieldParser(
     def type(self) -> str:
         return get_value(self.json_data, self.field_mapping.get("type", ""))
 
-    @property
+    @cached_property
     def object_id(self) -> Optional[str]:
-        id = get_value(self.json_data, self.field_mapping.get("object_id", ""))
+        id = get_value(self.json_data, self.field_mapping["object_id"])
         return (id.lower().replace("_", "").replace("-", ""))[len("indicator") :]
 
     @property
-    def supported_marketplaces(self) -> Set[MarketplaceVersions]:
-        return {
-            MarketplaceVersions.XSOAR,
-            MarketplaceVersions.MarketplaceV2,
-            MarketplaceVersions.XSOAR_SAAS,
-            MarketplaceVersions.XSOAR_ON_PREM,
-            MarketplaceVersions.PLATFORM,
-        }
+    def supported_marketplaces(self) -> FrozenSet[MarketplaceVersions]:
+        return _SUPPORTED_MARKETPLACES
 
     def connect_to_dependencies(self) -> None:
         """Collects indicator types used by the field as optional dependencies, and scripts as mandatory dependencies."""
-        for associated_type in set(self.json_data.get("associatedTypes") or []):
+        json_data = self.json_data
+        # the same indicator type may be in both lists, it is added once
+        associated_types = set(json_data.get("associatedTypes") or [])
+        associated_types.update(json_data.get("systemAssociatedTypes") or [])
+        for associated_type in associated_types:
             if associated_type:
                 self.add_dependency_by_name(
                     associated_type, ContentType.INDICATOR_TYPE, is_mandatory=False
                 )
 
-        for system_associated_type in set(
-            self.json_data.get("systemAssociatedTypes") or []
-        ):
-            if system_associated_type:
-                self.add_dependency_by_name(
-                    system_associated_type,
-                    ContentType.INDICATOR_TYPE,
-                    is_mandatory=False,
-                )
-
-        if script := self.json_data.get("script"):
+        if script := json_data.get("script"):
             self.add_dependency_by_id(script, ContentType.SCRIPT)
 
-        if field_calc_script := self.json_data.get("fieldCalcScript"):
+        if field_calc_script := json_data.get("fieldCalcScript"):
             self.add_dependency_by_id(field_calc_script, ContentType.SCRIPT)
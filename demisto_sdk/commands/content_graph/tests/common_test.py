@@ -307,6 +307,39 @@ def test_replace_marketplace_references_dicts(data, marketplace, expected):
         assert isinstance(result["folded"], original_type)
 
 
+def test_replace_marketplace_references__without_reference():
+    """
+    Given:
+        - Data whose strings do not contain "Cortex XSOAR".
+
+    When:
+        - Calling replace_marketplace_references for marketplacev2.
+
+    Then:
+        - The data should be returned unchanged, without scanning the strings with the pattern.
+    """
+    data = {
+        "name": "Cortex Pack",
+        "items": ["XSOAR", "description"],
+        "folded": FoldedScalarString("folded text"),
+    }
+
+    with patch(
+        "demisto_sdk.commands.content_graph.common.MARKETPLACE_REFERENCE_PATTERN"
+    ) as mock_pattern:
+        result = replace_marketplace_references(
+            data, MarketplaceVersions.MarketplaceV2, path="example/path"
+        )
+
+    assert result == {
+        "name": "Cortex Pack",
+        "items": ["XSOAR", "description"],
+        "folded": "folded text",
+    }
+    assert isinstance(result["folded"], FoldedScalarString)
+    mock_pattern.sub.assert_not_called()
+
+
 def test_replace_marketplace_references__error_handling():
     """
     Test the error handling of the replace_marketplace_references function.
@@ -0,0 +1,538 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+import pytest
+
+from demisto_sdk.commands.common.constants import (
+    SKIP_PREPARE_SCRIPT_NAME,
+    MarketplaceVersions,
+)
+from demisto_sdk.commands.content_graph.common import ContentType
+from demisto_sdk.commands.content_graph.objects.content_item import (
+    normalize_file_name,
+)
+from demisto_sdk.commands.content_graph.objects.pack import (
+    CONTENT_TYPE_TO_DUMP_FOLDER,
+    DUMP_PARALLELISM_ENV_VAR,
+    ZIP_LEVEL_ENV_VAR,
+    Pack,
+    _fast_copy,
+    _fast_copytree,
+    get_dump_max_workers,
+    get_zip_level,
+)
+from demisto_sdk.commands.content_graph.objects.pack_content_items import (
+    PackContentItems,
+)
+from demisto_sdk.commands.content_graph.objects.script import Script
+from demisto_sdk.commands.content_graph.tests.create_content_graph_test import (
+    mock_integration,
+    mock_script,
+)
+from demisto_sdk.commands.upload.constants import MULTIPLE_ZIPPED_PACKS_FILE_NAME
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [
+        ("4", 4),
+        ("1", 1),
+        ("0", 1),
+        ("false", 1),
+    ],
+)
+def test_get_dump_max_workers(monkeypatch, env_value, expected):
+    """
+    Given:
+        - The DEMISTO_SDK_DUMP_PARALLELISM environment variable set to a number or a boolean.
+    When:
+        - Calling get_dump_max_workers.
+    Then:
+        - Ensure the number of workers matches the variable, and a false-like value means serial dump.
+    """
+    monkeypatch.setenv(DUMP_PARALLELISM_ENV_VAR, env_value)
+    assert get_dump_max_workers() == expected
+
+
+@pytest.mark.parametrize("env_value", ["", "true", "not-a-number"])
+def test_get_dump_max_workers_default(monkeypatch, env_value):
+    """
+    Given:
+        - The DEMISTO_SDK_DUMP_PARALLELISM environment variable unset, true or invalid.
+    When:
+        - Calling get_dump_max_workers.
+    Then:
+        - Ensure the default number of workers is used.
+    """
+    monkeypatch.setenv(DUMP_PARALLELISM_ENV_VAR, env_value)
+    assert get_dump_max_workers() == min(32, (os.cpu_count() or 1) * 4)
+
+
+@pytest.mark.parametrize("env_value", ["1", "8"])
+def test_dump_content_items(monkeypatch, tmp_path: Path, env_value):
+    """
+    Given:
+        - Several content items to dump, serially and in parallel.
+    When:
+        - Calling Pack._dump_content_items.
+    Then:
+        - Ensure every content item is dumped once into its directory.
+    """
+    monkeypatch.setenv(DUMP_PARALLELISM_ENV_VAR, env_value)
+    items_to_dump = [(MagicMock(), tmp_path / f"dir{i}") for i in range(5)]
+
+    Pack._dump_content_items(
+        items_to_dump, MarketplaceVersions.XSOAR, strip_internal=True
+    )
+
+    for content_item, dir in items_to_dump:
+        content_item.dump.assert_called_once_with(
+            dir=dir, marketplace=MarketplaceVersions.XSOAR, strip_internal=True
+        )
+
+
+@pytest.mark.parametrize("env_value", ["1", "8"])
+def test_dump_content_items_raises(monkeypatch, tmp_path: Path, env_value):
+    """
+    Given:
+        - Content items to dump, one of which fails.
+    When:
+        - Calling Pack._dump_content_items.
+    Then:
+        - Ensure the exception of the failing dump is raised.
+    """
+    monkeypatch.setenv(DUMP_PARALLELISM_ENV_VAR, env_value)
+    failing_item = MagicMock()
+    failing_item.dump.side_effect = ValueError("failed")
+    items_to_dump = [(MagicMock(), tmp_path), (failing_item, tmp_path)]
+
+    with pytest.raises(ValueError, match="failed"):
+        Pack._dump_content_items(items_to_dump, MarketplaceVersions.XSOAR)
+
+
+def test_dump_content_items_cancels_pending_dumps(mocker, tmp_path: Path):
+    """
+    Given:
+        - Content items to dump in parallel, the first of which fails.
+    When:
+        - Calling Pack._dump_content_items.
+    Then:
+        - Ensure the exception is raised, and the dumps that did not start are cancelled.
+    """
+    released = threading.Event()
+    shutdown = ThreadPoolExecutor.shutdown
+
+    def shutdown_and_release(executor, wait=True, cancel_futures=False):
+        shutdown(executor, wait=False, cancel_futures=cancel_futures)
+        released.set()
+        shutdown(executor, wait=wait)
+
+    mocker.patch.object(ThreadPoolExecutor, "shutdown", shutdown_and_release)
+    failing_item = MagicMock()
+    failing_item.dump.side_effect = ValueError("failed")
+    # every started dump holds its thread until the pending dumps are cancelled
+    items = [MagicMock() for _ in range(6)]
+    for item in items:
+        item.dump.side_effect = lambda **kwargs: released.wait()
+    items_to_dump = [(item, tmp_path) for item in [failing_item, *items]]
+
+    with pytest.raises(ValueError, match="failed"):
+        Pack._dump_content_items(
+            items_to_dump, MarketplaceVersions.XSOAR, max_workers=2
+        )
+
+    # one dump runs alongside the failing one, and another one may start once it fails
+    for item in items[2:]:
+        item.dump.assert_not_called()
+
+
+def test_dump_content_items_serially(mocker, monkeypatch, tmp_path: Path):
+    """
+    Given:
+        - Content items to dump, with max_workers set to 1, as done when the packs
+          are dumped in parallel processes.
+    When:
+        - Calling Pack._dump_content_items.
+    Then:
+        - Ensure the items are dumped without a thread pool.
+    """
+    monkeypatch.setenv(DUMP_PARALLELISM_ENV_VAR, "8")
+    executor_mock = mocker.patch(
+        "demisto_sdk.commands.content_graph.objects.pack.ThreadPoolExecutor"
+    )
+    items_to_dump = [(MagicMock(), tmp_path) for _ in range(5)]
+
+    Pack._dump_content_items(items_to_dump, MarketplaceVersions.XSOAR, max_workers=1)
+
+    executor_mock.assert_not_called()
+    for content_item, _ in items_to_dump:
+        content_item.dump.assert_called_once()
+
+
+def test_items_by_type():
+    """
+    Given:
+        - Pack content items with scripts and an integration.
+    When:
+        - Calling PackContentItems.items_by_type.
+    Then:
+        - Ensure the items are grouped by type, without the types that have no items,
+          and that changing the groups does not change the pack content items.
+    """
+    scripts = [mock_script(), mock_script(name="OtherScript")]
+    integration = mock_integration()
+    content_items = PackContentItems(script=scripts, integration=[integration])
+
+    items_by_type = content_items.items_by_type()
+
+    assert items_by_type == {
+        ContentType.INTEGRATION: [integration],
+        ContentType.SCRIPT: scripts,
+    }
+    items_by_type[ContentType.SCRIPT].clear()
+    assert content_items.script == scripts
+
+
+def test_make_pack_zip(tmp_path: Path):
+    """
+    Given:
+        - A dumped pack directory with nested folders.
+    When:
+        - Calling Pack._make_pack_zip.
+    Then:
+        - Ensure the pack zip is named after the pack and holds the same entries shutil.make_archive would create.
+    """
+    dump_dir = tmp_path / "dump"
+    (dump_dir / "Scripts").mkdir(parents=True)
+    (dump_dir / "Scripts" / "script-Test.yml").write_text("name: Test")
+    (dump_dir / "metadata.json").write_text("{}")
+    zips_dir = tmp_path / "zips"
+    zips_dir.mkdir()
+    fake_pack = MagicMock()
+    fake_pack.name = "TestPack"
+    fake_pack.zip_dumped_pack = Pack.zip_dumped_pack
+
+    pack_zip_path = Pack._make_pack_zip(fake_pack, dump_dir, zips_dir)
+
+    assert pack_zip_path == zips_dir / "TestPack.zip"
+    with ZipFile(pack_zip_path) as zip_file:
+        assert set(zip_file.namelist()) == {
+            "Scripts/",
+            "Scripts/script-Test.yml",
+            "metadata.json",
+        }
+        assert zip_file.read("Scripts/script-Test.yml") == b"name: Test"
+
+
+def test_zip_dumped_pack_into_stream(tmp_path: Path):
+    """
+    Given:
+        - A dumped pack directory.
+    When:
+        - Calling Pack.zip_dumped_pack with an entry of another zip file.
+    Then:
+        - Ensure the pack zip is written into the entry, holding the pack files.
+    """
+    dump_dir = tmp_path / "TestPack"
+    (dump_dir / "Scripts").mkdir(parents=True)
+    (dump_dir / "Scripts" / "script-Test.yml").write_text("name: Test")
+    outer_zip_path = tmp_path / MULTIPLE_ZIPPED_PACKS_FILE_NAME
+
+    with ZipFile(outer_zip_path, "w") as outer_zip:
+        with outer_zip.open("TestPack.zip", "w") as pack_zip:
+            Pack.zip_dumped_pack(dump_dir, pack_zip)
+
+    with ZipFile(outer_zip_path) as outer_zip:
+        outer_zip.extract("TestPack.zip", tmp_path / "extracted")
+    with ZipFile(tmp_path / "extracted" / "TestPack.zip") as pack_zip:
+        assert pack_zip.read("Scripts/script-Test.yml") == b"name: Test"
+
+
+@pytest.mark.parametrize(
+    "env_value, expected",
+    [("", 1), ("0", 0), ("9", 9), ("10", 1), ("not-a-number", 1)],
+)
+def test_get_zip_level(monkeypatch, env_value, expected):
+    """
+    Given:
+        - The DEMISTO_SDK_ZIP_LEVEL environment variable unset, set to a level, or invalid.
+    When:
+        - Calling get_zip_level.
+    Then:
+        - Ensure the level matches the variable, and the default level is used otherwise.
+    """
+    monkeypatch.setenv(ZIP_LEVEL_ENV_VAR, env_value)
+    assert get_zip_level() == expected
+
+
+@pytest.mark.parametrize(
+    "env_value, expected_compression", [("1", ZIP_DEFLATED), ("0", ZIP_STORED)]
+)
+def test_zip_dumped_pack_level(
+    monkeypatch, tmp_path: Path, env_value, expected_compression
+):
+    """
+    Given:
+        - A dumped pack directory, and the DEMISTO_SDK_ZIP_LEVEL environment variable.
+    When:
+        - Calling Pack.zip_dumped_pack.
+    Then:
+        - Ensure the files are stored without compression when the level is 0.
+    """
+    monkeypatch.setenv(ZIP_LEVEL_ENV_VAR, env_value)
+    dump_dir = tmp_path / "TestPack"
+    dump_dir.mkdir()
+    (dump_dir / "pack_metadata.json").write_text("{}")
+
+    Pack.zip_dumped_pack(dump_dir, tmp_path / "TestPack.zip")
+
+    with ZipFile(tmp_path / "TestPack.zip") as pack_zip:
+        assert pack_zip.getinfo("pack_metadata.json").compress_type == (
+            expected_compression
+        )
+        assert pack_zip.read("pack_metadata.json") == b"{}"
+
+
+def test_wrap_into_uploadable(tmp_path: Path):
+    """
+    Given:
+        - A pack zip.
+    When:
+        - Calling Pack._wrap_into_uploadable.
+    Then:
+        - Ensure uploadable_packs.zip is created in the destination, holding the pack zip.
+    """
+    pack_zip_path = tmp_path / "TestPack.zip"
+    with ZipFile(pack_zip_path, "w") as zip_file:
+        zip_file.writestr("metadata.json", "{}")
+
+    Pack._wrap_into_uploadable(pack_zip_path, tmp_path)
+
+    with ZipFile(tmp_path / MULTIPLE_ZIPPED_PACKS_FILE_NAME) as zip_file:
+        assert zip_file.namelist() == ["TestPack.zip"]
+
+
+@pytest.mark.parametrize("link", [True, False])
+def test_fast_copytree(tmp_path: Path, link):
+    """
+    Given:
+        - A directory with nested files.
+    When:
+        - Calling _fast_copytree, with and without hard-linking.
+    Then:
+        - Ensure the files are copied with their content.
+        - Ensure the files are hard-linked only when requested.
+    """
+    src = tmp_path / "ReleaseNotes"
+    (src / "nested").mkdir(parents=True)
+    (src / "1_0_1.md").write_text("notes")
+    (src / "nested" / "1_0_2.md").write_text("more notes")
+    dst = tmp_path / "out" / "ReleaseNotes"
+
+    _fast_copytree(src, dst, link=link)
+
+    assert (dst / "1_0_1.md").read_text() == "notes"
+    assert (dst / "nested" / "1_0_2.md").read_text() == "more notes"
+    assert (dst / "1_0_1.md").samefile(src / "1_0_1.md") is link
+
+
+def test_fast_copy_missing_source(tmp_path: Path):
+    """
+    Given:
+        - A source file that does not exist.
+    When:
+        - Calling _fast_copy.
+    Then:
+        - Ensure FileNotFoundError is raised, as Pack.dump relies on it to skip optional files.
+    """
+    with pytest.raises(FileNotFoundError):
+        _fast_copy(tmp_path / "Author_image.png", tmp_path / "out.png", link=True)
+
+
+@pytest.mark.parametrize(
+    "content_type, expected_folder",
+    [
+        (ContentType.SCRIPT, "Scripts"),
+        (ContentType.MAPPER, "Classifiers"),
+        (ContentType.CASE_LAYOUT, "Layouts"),
+    ],
+)
+def test_content_type_to_dump_folder(content_type, expected_folder):
+    """
+    Given:
+        - A content type.
+    When:
+        - Looking up the folder it is dumped into.
+    Then:
+        - Ensure the folder matches the server content structure.
+    """
+    assert CONTENT_TYPE_TO_DUMP_FOLDER[content_type] == expected_folder
+
+
+@pytest.mark.parametrize(
+    "file_name, content_type, expected",
+    [
+        ("MyScript.yml", ContentType.SCRIPT, "script-MyScript.yml"),
+        ("script-MyScript.yml", ContentType.SCRIPT, "script-MyScript.yml"),
+        (
+            "classifier-mapper-MyMapper.json",
+            ContentType.MAPPER,
+            "classifier-mapper-MyMapper.json",
+        ),
+    ],
+)
+def test_normalize_file_name(file_name, content_type, expected):
+    """
+    Given:
+        - A content item file name, with or without server prefixes.
+    When:
+        - Calling normalize_file_name.
+    Then:
+        - Ensure the name has exactly the server prefix of the content type.
+    """
+    assert normalize_file_name(file_name, content_type) == expected
+
+
+def _dump_readme(mocker, tmp_path: Path, readme: str, marketplace, contributors=None):
+    """Invoke ``Pack.dump_readme`` with a stub ``self`` holding a pack README."""
+    mocker.patch(
+        "demisto_sdk.commands.content_graph.objects.pack.update_markdown_images_with_urls_and_rel_paths"
+    )
+    pack_path = tmp_path / "MyPack"
+    pack_path.mkdir()
+    (pack_path / "README.md").write_text(readme)
+    fake_pack = MagicMock()
+    fake_pack.path = pack_path
+    fake_pack.contributors = contributors
+    fake_pack.marketplaces = [marketplace]
+    output = tmp_path / "README.md"
+    Pack.dump_readme(fake_pack, output, marketplace)
+    return output.read_text()
+
+
+def test_dump_readme_without_marketplace_content(mocker, tmp_path: Path):
+    """
+    Given:
+        - A pack README without marketplace tags or references, and no contributors.
+    When:
+        - Calling Pack.dump_readme.
+    Then:
+        - Ensure the README is copied as is, without being parsed.
+    """
+    replace_mock = mocker.patch(
+        "demisto_sdk.commands.content_graph.objects.pack.replace_marketplace_references"
+    )
+
+    readme = "# MyPack\nA pack without anything to replace.\n"
+    assert (
+        _dump_readme(mocker, tmp_path, readme, MarketplaceVersions.MarketplaceV2)
+        == readme
+    )
+    replace_mock.assert_not_called()
+
+
+def test_dump_readme_with_marketplace_content(mocker, tmp_path: Path):
+    """
+    Given:
+        - A pack README with a marketplace tag and a Cortex XSOAR reference.
+    When:
+        - Calling Pack.dump_readme for marketplacev2.
+    Then:
+        - Ensure the tag block of the other marketplace is removed and the reference is replaced.
+    """
+    readme = "Use Cortex XSOAR.\n<~XSOAR>\nXSOAR only\n</~XSOAR>\n"
+    dumped = _dump_readme(mocker, tmp_path, readme, MarketplaceVersions.MarketplaceV2)
+
+    assert "XSOAR only" not in dumped
+    assert "Use Cortex." in dumped
+
+
+def test_dump_readme_with_contributors(mocker, tmp_path: Path):
+    """
+    Given:
+        - A pack README with a Cortex XSOAR reference, and pack contributors.
+    When:
+        - Calling Pack.dump_readme for marketplacev2.
+    Then:
+        - Ensure the contributors are appended and the reference is replaced, leaving the source README untouched.
+    """
+    readme = "Use Cortex XSOAR.\n"
+    dumped = _dump_readme(
+        mocker,
+        tmp_path,
+        readme,
+        MarketplaceVersions.MarketplaceV2,
+        contributors=["Jane Doe", "John Doe"],
+    )
+
+    assert dumped.startswith("Use Cortex.\n")
+    assert "### Pack Contributors:" in dumped
+    assert " - Jane Doe\n - John Doe\n" in dumped
+    assert (tmp_path / "MyPack" / "README.md").read_text() == readme
+
+
+def test_dump_incident_to_alert_script(mocker, tmp_path: Path):
+    """
+    Given:
+        - A script with `incident` in its name.
+    When:
+        - Dumping the script for marketplacev2.
+    Then:
+        - Ensure both the original script and its alert variant are dumped, each under its normalized name.
+    """
+    script = mock_script(
+        name="getIncident",
+        marketplaces=[MarketplaceVersions.MarketplaceV2],
+        path=tmp_path / "Scripts" / "getIncident" / "getIncident.yml",
+    )
+    mocker.patch.object(
+        Script,
+        "prepare_for_upload",
+        return_value={
+            "name": "getIncident",
+            "commonfields": {"id": "getIncident"},
+            "comment": "",
+            "script": "",
+            "type": "python",
+        },
+    )
+    output = tmp_path / "output"
+
+    script.dump(output, MarketplaceVersions.MarketplaceV2)
+
+    assert {path.name for path in output.iterdir()} == {
+        "script-getIncident.yml",
+        "script-getAlert.yml",
+    }
+
+
+@pytest.mark.parametrize(
+    "name, skip_prepare, marketplace, expected",
+    [
+        ("getIncident", [], MarketplaceVersions.MarketplaceV2, True),
+        ("getIncident", [], [MarketplaceVersions.PLATFORM], True),
+        ("getIncident", [], MarketplaceVersions.XSOAR, False),
+        (
+            "getIncident",
+            [SKIP_PREPARE_SCRIPT_NAME],
+            MarketplaceVersions.MarketplaceV2,
+            False,
+        ),
+        ("getAlert", [], MarketplaceVersions.MarketplaceV2, False),
+    ],
+)
+def test_is_incident_to_alert(name, skip_prepare, marketplace, expected):
+    """
+    Given:
+        - A script name, its skip_prepare list and a destination marketplace.
+    When:
+        - Calling is_incident_to_alert.
+    Then:
+        - Ensure only incident scripts that are not skipped need the preparation, for marketplacev2 and platform.
+    """
+    script = mock_script(name=name, skip_prepare=skip_prepare)
+    assert script.is_incident_to_alert(marketplace) is expected
@@ -150,6 +150,51 @@ class TestPackLevelIgnoredErrorsProperty:
             _ = pack.pack_level_ignored_errors
 
 
+class TestGetIgnoredErrors:
+    """Verify `Pack.get_ignored_errors` reads the `[file:...]` sections."""
+
+    def test_file_section_returns_codes(self):
+        """
+        Given a .pack-ignore with a [file:...] section,
+        When get_ignored_errors is called for that file,
+        Then it should return the listed error codes.
+        """
+        pack = _make_pack("[file:foo.yml]\nignore=BA101,IN122\n")
+        assert pack.get_ignored_errors("foo.yml") == ["BA101", "IN122"]
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "[file:bar.yml]\nignore=BA101\n",
+            "[file:foo.yml]\n",
+            "[file:foo.yml]\nignore\n",
+        ],
+    )
+    def test_missing_or_empty_section_returns_empty(self, text):
+        """
+        Given a .pack-ignore without a section for the file, or with an empty one,
+        When get_ignored_errors is called for that file,
+        Then it should return an empty list.
+        """
+        pack = _make_pack(text)
+        assert pack.get_ignored_errors("foo.yml") == []
+
+    def test_ignored_errors_follow_pack_path(self):
+        """
+        Given a .pack-ignore with a section for the pack metadata by its relative path,
+        When ignored_errors is accessed, and again after the pack path is replaced,
+        Then it should return the codes of the current pack path only.
+        """
+        from demisto_sdk.commands.common.content_constant_paths import CONTENT_PATH
+
+        pack = _make_pack("[file:Packs/TestPack/pack_metadata.json]\nignore=BA101\n")
+        object.__setattr__(pack, "path", CONTENT_PATH / "Packs" / "TestPack")
+        assert pack.ignored_errors == ["BA101"]
+
+        object.__setattr__(pack, "path", CONTENT_PATH / "Packs" / "OtherPack")
+        assert pack.ignored_errors == []
+
+
 # ---------------------------------------------------------------------------
 # Slice 2: is_error_ignored
 # ---------------------------------------------------------------------------
@@ -688,6 +688,38 @@ class TestParsersAndModels:
         assert model.cli_name == "email"
         assert not model.associated_to_all
 
+    def test_indicator_field_parser_system_associated_types(self, pack: Pack):
+        """
+        Given:
+            - A pack with an indicator field, associated to an indicator type both
+              as an associated type and as a system associated type.
+        When:
+            - Creating the content item's parser.
+        Then:
+            - Verify the indicator types of both lists are collected as dependencies.
+        """
+        from demisto_sdk.commands.content_graph.parsers.indicator_field import (
+            IndicatorFieldParser,
+        )
+
+        indicator_field_json = load_json("indicator_field.json")
+        indicator_field_json["systemAssociatedTypes"] = ["User Profile", "Domain", ""]
+        indicator_field = pack.create_incident_field(
+            "TestIndicatorField", indicator_field_json
+        )
+        parser = IndicatorFieldParser(
+            Path(indicator_field.path),
+            list(MarketplaceVersions),
+            pack_supported_modules=[],
+        )
+        RelationshipsVerifier.run(
+            parser.relationships,
+            dependency_names={
+                "User Profile": ContentType.INDICATOR_TYPE,
+                "Domain": ContentType.INDICATOR_TYPE,
+            },
+        )
+
     def test_indicator_type_parser(self, pack: Pack):
         """
         Given:
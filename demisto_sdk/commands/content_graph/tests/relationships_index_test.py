@@ -0,0 +1,113 @@
+import pickle
+
+from demisto_sdk.commands.content_graph.common import RelationshipType
+from demisto_sdk.commands.content_graph.objects.relationship import RelationshipData
+from demisto_sdk.commands.content_graph.tests.create_content_graph_test import (
+    mock_integration,
+    mock_script,
+)
+
+
+def _imports_relationship(integration, source_id: str, target_id: str):
+    return RelationshipData(
+        relationship_type=RelationshipType.IMPORTS,
+        source_id=source_id,
+        target_id=target_id,
+        content_item_to=integration,
+    )
+
+
+def _mock_script_with_importing_integration():
+    script = mock_script()
+    script.database_id = "1"
+    integration = mock_integration()
+    integration.database_id = "2"
+    script.add_relationship(
+        RelationshipType.IMPORTS,
+        _imports_relationship(integration, source_id="2", target_id="1"),
+    )
+    return script, integration
+
+
+def test_incoming_and_outgoing_relationships():
+    """
+    Given:
+        - A script imported by an integration, and importing another integration.
+    When:
+        - Getting the incoming and outgoing IMPORTS relationships of the script.
+    Then:
+        - Ensure each relationship is returned by its direction only.
+    """
+    script, integration = _mock_script_with_importing_integration()
+    imported_integration = mock_integration(name="ImportedIntegration")
+    imported_integration.database_id = "3"
+    script.add_relationship(
+        RelationshipType.IMPORTS,
+        _imports_relationship(imported_integration, source_id="1", target_id="3"),
+    )
+
+    assert script.imported_by == [integration]
+    assert [
+        r.content_item_to
+        for r in script.outgoing_relationships(RelationshipType.IMPORTS)
+    ] == [imported_integration]
+
+
+def test_relationships_index_is_refreshed():
+    """
+    Given:
+        - A script whose incoming IMPORTS relationships were already looked up.
+    When:
+        - Adding a relationship, and replacing the relationships data.
+    Then:
+        - Ensure the lookups reflect the current relationships.
+    """
+    script, integration = _mock_script_with_importing_integration()
+    assert script.imported_by == [integration]
+
+    other_integration = mock_integration(name="OtherIntegration")
+    other_integration.database_id = "3"
+    script.add_relationship(
+        RelationshipType.IMPORTS,
+        _imports_relationship(other_integration, source_id="3", target_id="1"),
+    )
+    assert {i.object_id for i in script.imported_by} == {
+        integration.object_id,
+        other_integration.object_id,
+    }
+
+    script.relationships_data = {RelationshipType.IMPORTS: set()}
+    assert script.imported_by == []
+
+
+def test_relationships_index_after_pickle():
+    """
+    Given:
+        - A script whose relationships were already looked up.
+    When:
+        - Pickling and unpickling the script, as done when running in multiple processes.
+    Then:
+        - Ensure the relationships can still be looked up, as the index is not pickled.
+    """
+    script = mock_script()
+    assert script.imported_by == []
+
+    unpickled_script = pickle.loads(pickle.dumps(script))
+
+    assert unpickled_script.imported_by == []
+
+
+def test_relationships_index_is_not_changed_by_callers():
+    """
+    Given:
+        - A script imported by an integration.
+    When:
+        - Changing the list of incoming IMPORTS relationships returned for the script.
+    Then:
+        - Ensure later lookups still return the relationships of the script.
+    """
+    script, integration = _mock_script_with_importing_integration()
+
+    script.incoming_relationships(RelationshipType.IMPORTS).clear()
+
+    assert script.imported_by == [integration]
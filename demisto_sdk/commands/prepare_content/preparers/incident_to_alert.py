@@ -168,8 +168,10 @@ def edit_ids_names_and_descriptions_for_script(
         for pattern, replace_with in NOT_WRAPPED_RE_MAPPING.items():
             data = re.sub(pattern, replace_with, data)
 
-    for pattern, replace_with in WRAPPED_MAPPING.items():
-        data = re.sub(pattern, replace_with, data)
+    # most fields have no wrapped words, so they are not scanned by the patterns
+    if "<-" in data:
+        for pattern, replace_with in WRAPPED_MAPPING.items():
+            data = re.sub(pattern, replace_with, data)
     return data
 
 
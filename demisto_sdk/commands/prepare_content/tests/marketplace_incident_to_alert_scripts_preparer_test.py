@@ -2,6 +2,9 @@ import pytest
 
 from demisto_sdk.commands.common.constants import MarketplaceVersions
 from demisto_sdk.commands.common.legacy_git_tools import git_path
+from demisto_sdk.commands.prepare_content.preparers.incident_to_alert import (
+    edit_ids_names_and_descriptions_for_script,
+)
 from demisto_sdk.commands.prepare_content.preparers.marketplace_incident_to_alert_scripts_prepare import (
     MarketplaceIncidentToAlertScriptsPreparer,
 )
@@ -119,3 +122,30 @@ def test_marketplace_incident_to_alert_deprecated_scripts_preparer(
         assert data[i].get("name") == script_name
 
     assert all([i["deprecated"] for i in data])
+
+
+@pytest.mark.parametrize(
+    "text, incident_to_alert, expected",
+    [
+        ("Closes the <-incident->.", False, "Closes the incident."),
+        ("Closes the incident.", False, "Closes the incident."),
+        (
+            "Closes the incident, not the <-incident->.",
+            True,
+            "Closes the alert, not the incident.",
+        ),
+        ("Closes the incident.", True, "Closes the alert."),
+    ],
+)
+def test_edit_ids_names_and_descriptions_for_script(text, incident_to_alert, expected):
+    """
+    Given:
+        - A script description, with and without a wrapped word.
+    When:
+        - Calling edit_ids_names_and_descriptions_for_script.
+    Then:
+        - Ensure the wrapped words are unwrapped in any case, and the rest are replaced only when incident_to_alert is true.
+    """
+    assert (
+        edit_ids_names_and_descriptions_for_script(text, incident_to_alert) == expected
+    )
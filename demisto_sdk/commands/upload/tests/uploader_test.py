@@ -1,6 +1,9 @@
 import shutil
+import threading
 import zipfile
 from builtins import len
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -24,6 +27,7 @@ from demisto_sdk.commands.common.constants import (
 from demisto_sdk.commands.common.handlers import DEFAULT_JSON_HANDLER as json
 from demisto_sdk.commands.common.legacy_git_tools import git_path
 from demisto_sdk.commands.common.tools import src_root
+from demisto_sdk.commands.content_graph.common import ContentType
 from demisto_sdk.commands.content_graph.objects.content_item import ContentItem
 from demisto_sdk.commands.content_graph.objects.dashboard import Dashboard
 from demisto_sdk.commands.content_graph.objects.incident_field import IncidentField
@@ -456,6 +460,95 @@ def test_upload_pack_with_tpb(demisto_client_configure, mocker, tmpdir):
     assert mocked_upload_method.call_count == len(expected_names)
 
 
+@pytest.mark.parametrize("parallelism", ["1", "8"])
+def test_upload_pack_with_failing_item(
+    demisto_client_configure, mocker, monkeypatch, tmpdir, parallelism
+):
+    """
+    Given
+        - A pack called DummyPack, one of whose content items fails to upload
+
+    When
+        - Uploading the pack item by item, one item at a time and concurrently
+
+    Then
+        - Ensure the upload fails with ERROR_RETURN_CODE
+        - Ensure only the failing item is reported as failed, and the rest are uploaded
+    """
+    monkeypatch.setenv("DEMISTO_SDK_UPLOAD_PARALLELISM", parallelism)
+    mocker.patch.object(demisto_client, "configure", return_value="object")
+    mocker.patch.object(
+        IntegrationScript, "get_supported_native_images", return_value=[]
+    )
+
+    def upload(content_item: ContentItem, **kwargs):
+        if content_item.path.name == "DummyPlaybook.yml":
+            raise ApiException(reason="Failed to establish a new connection:")
+
+    path = Path(f"{git_path()}/demisto_sdk/tests/test_files/Packs/DummyPack")
+    uploader = Uploader(path, destination_zip_dir=tmpdir)
+    mocker.patch.object(uploader, "client")
+    mocker.patch.object(ContentItem, "upload", autospec=True, side_effect=upload)
+
+    assert uploader.upload() == ERROR_RETURN_CODE
+
+    assert [
+        failed_item.path.name
+        for failed_item, _ in uploader._failed_upload_content_items
+    ] == ["DummyPlaybook.yml"]
+    assert len(uploader._successfully_uploaded_content_items) == 14
+
+
+def test_upload_item_by_item_stops_on_unexpected_error(mocker, monkeypatch):
+    """
+    Given
+        - Pack content items, the first of which fails to upload with an unexpected error
+
+    When
+        - Uploading the pack item by item, one item at a time
+
+    Then
+        - Ensure the error is raised
+        - Ensure the items queued after the failing one are not uploaded
+    """
+    from demisto_sdk.commands.content_graph.objects.pack import Pack
+
+    monkeypatch.setenv("DEMISTO_SDK_UPLOAD_PARALLELISM", "1")
+    released = threading.Event()
+    shutdown = ThreadPoolExecutor.shutdown
+
+    def shutdown_and_release(executor, wait=True, cancel_futures=False):
+        shutdown(executor, wait=False, cancel_futures=cancel_futures)
+        released.set()
+        shutdown(executor, wait=wait)
+
+    mocker.patch.object(ThreadPoolExecutor, "shutdown", shutdown_and_release)
+    uploaded = []
+
+    def upload(item, **kwargs):
+        if item is items[0]:
+            raise RuntimeError("unexpected")
+        # holds the worker until the pending uploads are cancelled
+        released.wait()
+        uploaded.append(item)
+
+    items = [MagicMock(content_type=ContentType.SCRIPT) for _ in range(10)]
+    for item in items:
+        item.upload.side_effect = partial(upload, item)
+    fake_pack = MagicMock()
+    fake_pack.content_items.items_by_type.return_value = {ContentType.SCRIPT: items}
+
+    with pytest.raises(RuntimeError, match="unexpected"):
+        Pack._upload_item_by_item(
+            fake_pack, MagicMock(), MarketplaceVersions.XSOAR, Version("8.0.0")
+        )
+
+    # the worker picks the next item once the first one fails, the rest are cancelled
+    assert set(uploaded) <= {items[1]}
+    for item in items[2:]:
+        item.upload.assert_not_called()
+
+
 def test_upload_pack_with_job_fails(mocker, repo, tmpdir):
     """
     Given
@@ -489,7 +582,7 @@ def test_upload_pack_with_job_fails(mocker, repo, tmpdir):
     assert "cannot be uploaded as part of a pack" in error_msg
 
 
-def test_upload_packs_from_configfile(demisto_client_configure, mocker):
+def test_upload_packs_from_configfile(demisto_client_configure, mocker, tmp_path):
     """
     Given
         - Config file with two packs
@@ -501,7 +594,8 @@ def test_upload_packs_from_configfile(demisto_client_configure, mocker):
         - Ensure the Uploader().upload called twice
     """
     mocker.patch.object(demisto_client, "configure", return_value="object")
-    with Path(f"{git_path()}/configfile_test.json").open("w+") as config_file:
+    config_file_path = tmp_path / "configfile_test.json"
+    with config_file_path.open("w+") as config_file:
         json.dump(
             {
                 "custom_packs": [
@@ -525,7 +619,7 @@ def test_upload_packs_from_configfile(demisto_client_configure, mocker):
     runner = CliRunner()
     runner.invoke(
         app,
-        ["upload", "--input-config-file", f"{git_path()}/configfile_test.json", "-nz"],
+        ["upload", "--input-config-file", str(config_file_path), "-nz"],
     )
 
     assert upload_mock.call_count == 2
@@ -84,6 +84,7 @@ def upload_content_entity(**kwargs):
             marketplace=marketplace,
             destination_zip_dir=destination_zip_path,
             private_pack_path=private_pack_path,
+            keep_zip=bool(keep_zip),
             **kwargs,
         ).upload()
         if result == ABORTED_RETURN_CODE:
@@ -140,8 +141,12 @@ def zip_multiple_packs(
             for was_zipped in were_zipped:
                 zip_file.write(was_zipped, was_zipped.name)
             for pack_path in tmp_dir_path.iterdir():
-                shutil.make_archive(str(pack_path), "zip", pack_path)
-                zip_file.write(pack_path.with_suffix(".zip"), f"{pack_path.name}.zip")
+                # stream the pack zip into the result, without writing it to disk first.
+                # its size is not known in advance, so zip64 is forced for packs over 2 GiB
+                with zip_file.open(
+                    f"{pack_path.name}.zip", "w", force_zip64=True
+                ) as pack_zip:
+                    Pack.zip_dumped_pack(pack_path, pack_zip)
 
     return [pack.name for pack in packs] + [path.name for path in were_zipped]
 
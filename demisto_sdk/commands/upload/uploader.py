@@ -77,6 +77,7 @@ class Uploader:
         tpb: bool = False,
         destination_zip_dir: Optional[Path] = None,
         private_pack_path: Optional[Path] = None,
+        keep_zip: bool = False,
         **kwargs,
     ):
         self.path = None if input is None else Path(input)
@@ -106,6 +107,7 @@ class Uploader:
         self.zip = zip  # -z flag
         self.tpb = tpb  # -tpb flag
         self.destination_zip_dir = destination_zip_dir
+        self.keep_zip = keep_zip  # --keep-zip flag
         self.private_pack_path = (
             None if not private_pack_path else Path(private_pack_path)
         )
@@ -301,6 +303,7 @@ class Uploader:
                 zip=self.zip,  # only used for Packs
                 tpb=self.tpb,  # only used for Packs
                 destination_zip_dir=self.destination_zip_dir,  # only used for Packs
+                keep_zip=self.keep_zip,  # only used for Packs
             )
 
             # upon reaching this line, the upload is surely successful
@@ -712,6 +712,37 @@ def test_IsValidCheckboxDefaultFieldValidator_obtain_invalid_content_items(
     )
 
 
+def test_IsValidCheckboxDefaultFieldValidator_fix_integrations_with_same_name():
+    """
+    Given
+        Two integrations with the same name, each with a different required checkbox param.
+    When
+    - Calling the IsValidCheckboxDefaultFieldValidator obtain_invalid_content_items and fix functions.
+    Then
+        - Make sure each integration is fixed by its own misconfigured params only.
+    """
+    content_items = [
+        create_integration_object(
+            paths=["configuration"],
+            values=[
+                [
+                    {"name": param_name, "type": 8, "display": "", "required": True},
+                    {"name": other_param_name, "type": 0, "required": True},
+                ]
+            ],
+        )
+        for param_name, other_param_name in (("first", "second"), ("second", "first"))
+    ]
+    assert content_items[0].name == content_items[1].name
+    validator = IsValidCheckboxDefaultFieldValidator()
+    assert len(validator.obtain_invalid_content_items(content_items)) == 2
+
+    for content_item in content_items:
+        validator.fix(content_item)
+        assert not content_item.params[0].required
+        assert content_item.params[1].required
+
+
 def test_IsValidCheckboxDefaultFieldValidator_fix():
     """
     Given
@@ -736,7 +767,7 @@ def test_IsValidCheckboxDefaultFieldValidator_fix():
     )
     assert content_item.params[0].required
     validator = IsValidCheckboxDefaultFieldValidator()
-    validator.misconfigured_checkbox_params_by_integration[content_item.name] = [
+    validator.misconfigured_checkbox_params_by_integration[content_item.path] = [
         "test_param",
     ]
     assert (
@@ -1,19 +1,14 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Union
+from typing import Iterable, List
 
 from demisto_sdk.commands.common.constants import ExecutionMode
-from demisto_sdk.commands.content_graph.objects import AgentixAction
-from demisto_sdk.commands.content_graph.objects.integration import Integration
-from demisto_sdk.commands.content_graph.objects.playbook import Playbook
-from demisto_sdk.commands.content_graph.objects.script import Script
 from demisto_sdk.commands.validate.validators.base_validator import ValidationResult
 from demisto_sdk.commands.validate.validators.GR_validators.GR110_is_agentix_action_using_existing_content_item_valid import (
+    ContentTypes,
     IsAgentixActionUsingExistingContentItemValidator,
 )
 
-ContentTypes = Union[AgentixAction, Integration, Script, Playbook]
-
 
 class IsAgentixActionUsingExistingContentItemValidatorAllFiles(
     IsAgentixActionUsingExistingContentItemValidator
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import ClassVar, Iterable, List
+from operator import attrgetter
+from pathlib import Path
+from typing import ClassVar, Dict, Iterable, List
 
 from demisto_sdk.commands.common.constants import REQUIRED_ALLOWED_PARAMS, ParameterType
 from demisto_sdk.commands.content_graph.objects.integration import (
@@ -14,6 +16,9 @@ from demisto_sdk.commands.validate.validators.base_validator import (
 )
 
 ContentTypes = Integration
+_REQUIRED_ALLOWED_PARAMS = frozenset(REQUIRED_ALLOWED_PARAMS)
+_CHECKBOX_TYPE = ParameterType.BOOLEAN.value
+_get_checkbox_fields = attrgetter("type", "name", "required")
 
 
 class IsValidCheckboxDefaultFieldValidator(BaseValidator[ContentTypes]):
@@ -24,11 +29,14 @@ class IsValidCheckboxDefaultFieldValidator(BaseValidator[ContentTypes]):
     fix_message = "Set required field of the following params was set to False: {0}."
     related_field = "configuration"
     is_auto_fixable = True
-    misconfigured_checkbox_params_by_integration: ClassVar[dict] = {}
+    # keyed by the integration path, as integrations of different packs may share a name
+    misconfigured_checkbox_params_by_integration: ClassVar[Dict[Path, List[str]]] = {}
 
     def obtain_invalid_content_items(
         self, content_items: Iterable[ContentTypes]
     ) -> List[ValidationResult]:
+        # only the integrations of the current run are kept for the fix
+        self.misconfigured_checkbox_params_by_integration.clear()
         return [
             ValidationResult(
                 validator=self,
@@ -40,36 +48,36 @@ class IsValidCheckboxDefaultFieldValidator(BaseValidator[ContentTypes]):
             for content_item in content_items
             if (
                 misconfigured_checkbox_params := self.get_misconfigured_checkbox_params(
-                    content_item.params, content_item.name
+                    content_item.params, content_item.path
                 )
             )
         ]
 
     def get_misconfigured_checkbox_params(
-        self, params: List[Parameter], integration_name: str
-    ):
-        self.misconfigured_checkbox_params_by_integration[integration_name] = [
-            param.name
-            for param in params
-            if param.type == ParameterType.BOOLEAN.value
-            and param.name not in REQUIRED_ALLOWED_PARAMS
-            and param.required
-        ]
-        return self.misconfigured_checkbox_params_by_integration[integration_name]
+        self, params: List[Parameter], integration_path: Path
+    ) -> List[str]:
+        if misconfigured_checkbox_params := [
+            name
+            for param_type, name, required in map(_get_checkbox_fields, params)
+            if param_type == _CHECKBOX_TYPE
+            and name not in _REQUIRED_ALLOWED_PARAMS
+            and required
+        ]:
+            self.misconfigured_checkbox_params_by_integration[integration_path] = (
+                misconfigured_checkbox_params
+            )
+        return misconfigured_checkbox_params
 
     def fix(self, content_item: ContentTypes) -> FixResult:
+        misconfigured_checkbox_params = (
+            self.misconfigured_checkbox_params_by_integration[content_item.path]
+        )
+        misconfigured_checkbox_param_names = set(misconfigured_checkbox_params)
         for param in content_item.params:
-            if (
-                param.name
-                in self.misconfigured_checkbox_params_by_integration[content_item.name]
-            ):
+            if param.name in misconfigured_checkbox_param_names:
                 param.required = False
         return FixResult(
             validator=self,
-            message=self.fix_message.format(
-                ", ".join(
-                    self.misconfigured_checkbox_params_by_integration[content_item.name]
-                )
-            ),
+            message=self.fix_message.format(", ".join(misconfigured_checkbox_params)),
             content_object=content_item,
         )
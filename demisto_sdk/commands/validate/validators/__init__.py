@@ -4,19 +4,16 @@ so 'BaseValidator.__subclasses__()' will recognize them when called from filter_
 """
 
 import importlib
-import sys
 from pathlib import Path
 
 package_path = Path(__path__[0])
-sys.path.append(str(package_path))
 
 for folder in package_path.rglob("*.py"):
     if not folder.name.startswith("__"):
-        module_name = (
-            folder.relative_to(package_path)
-            .with_suffix("")
-            .as_posix()
-            .replace("/", ".")
+        # the modules are imported by their full name, the same as the all files and list files
+        # validators import their base validator, so each module is only imported once
+        module_name = ".".join(
+            (__name__, *folder.relative_to(package_path).with_suffix("").parts)
         )
 
         # Import module